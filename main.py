@@ -1,16 +1,47 @@
 import time
 import argparse
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from requests.exceptions import HTTPError, RequestException
 from youtube_transcript_api._api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from youtube_transcript_api._errors import (
+    TranscriptsDisabled,
+    NoTranscriptFound,
+    RequestBlocked,
+    YouTubeRequestFailed,
+)
 import re
+import msgspec
+import pyperclip
+import zstandard
+from diskcache import Cache
 from loguru import logger
 import subprocess
+from sqlalchemy import Index, event
 from sqlmodel import SQLModel, Field, Session, select, create_engine
 import datetime
 import os
+import sys
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 PROJECT_BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(PROJECT_BASE_PATH, "data/transcripts.db")
+PROMPTS_PATH = os.path.join(PROJECT_BASE_PATH, "data/prompts")
+MAX_RETRIES = 7
+BASE_RETRY_DELAY = 2  # seconds
+RETRY_DELAY_CAP = 30  # seconds
+RATE_LIMIT_DELAY_CAP = 120  # seconds
+NON_NETWORK_MAX_TRIES = 2
+MAX_WORKERS = 8
+TRANSCRIPT_COMPRESSION_LEVEL = 3
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+MAX_CLIPBOARD_CHARS = 5_000_000  # larger copies tend to stall clipboard managers
+RAW_TRANSCRIPT_TTL = 24 * 60 * 60  # seconds
+raw_transcript_cache = Cache(os.path.join(PROJECT_BASE_PATH, ".cache"))
+# Matches watch?v=<id>, youtu.be/<id> and /shorts/<id> with a canonical 11-character ID
+VIDEO_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/)([\w-]{11})(?![\w-])")
+WORD_RE = re.compile(r"\S+")
 SUMMARIZATION_PROMPT = """**Persona:** You are an Expert Video Content Analyst and Summarizer. Your expertise lies in distilling complex video information into clear, concise, and actionable summaries.
 
 **Primary Goal:** To create a comprehensive yet digestible summary of the provided YouTube video. This summary must enable a user to thoroughly understand the video's core message, key announcements, significant data points, strategic implications, and any calls to action, effectively replacing the need for them to watch the video itself.
@@ -68,15 +99,22 @@ SUMMARIZATION_PROMPT = """**Persona:** You are an Expert Video Content Analyst a
 **TimeStamped Video Transcript:**
 {video_transcript}
 """
+SUMMARY_LANGUAGE = "Original Language of the video"
+# Fill in the fixed summary language and split once at import, so prompts are assembled
+# from parts without re-parsing the template
+PROMPT_HEAD, _, PROMPT_BODY = SUMMARIZATION_PROMPT.replace(
+    "{summary_language}", SUMMARY_LANGUAGE
+).partition("{youtube_video_url}")
+PROMPT_MIDDLE, _, PROMPT_TAIL = PROMPT_BODY.partition("{video_transcript}")
 # youtube_video_url = "https://www.youtube.com/watch?v=FCE_JyeJzJg&list=PLFr7f4WLNwrZzhz-YDjha6j3Z9ymjo7rD&index=3"
 
 
 def extract_video_id(url: str) -> str:
     """
-    Extracts the video ID from a YouTube URL.
+    Extracts the video ID from a YouTube watch, youtu.be or shorts URL.
     Raises a ValueError if unable to extract the video ID.
     """
-    match = re.search(r"v=([\w-]+)", url)
+    match = VIDEO_ID_RE.search(url)
     if match:
         return match.group(1)
     raise ValueError("[Error] Could not extract video ID from URL.")
@@ -87,106 +125,293 @@ def convert_seconds_to_timestamp(seconds: float) -> str:
     Converts a time duration in seconds to a timestamp string (HH:MM:SS),
     with each part zero-padded to 2 digits.
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+    # Two integer divmods instead of three float divisions/modulos
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
 
     # Use the :02 format specifier to pad each part with a leading zero if needed
     return f"{hours:02}:{minutes:02}:{seconds:02}"
 
 
-def get_video_transcript(video_id: str, proxy: str | None = None) -> tuple[str, str]:
+def is_rate_limited(error: Exception) -> bool:
+    """
+    Returns True if the error indicates that YouTube is rate limiting or blocking us.
+    Decided on the HTTP status only, since error messages also contain video IDs and URLs.
+    """
+    if isinstance(error, RequestBlocked):
+        return True
+    if isinstance(error, YouTubeRequestFailed):
+        # reason is str(HTTPError), which starts with the status code
+        return error.reason.startswith("429")
+    if isinstance(error, RequestException):
+        return error.response is not None and error.response.status_code == 429
+    return False
+
+
+def is_network_error(error: Exception) -> bool:
+    """
+    Returns True if the error is a transient network/HTTP failure worth retrying.
+    """
+    return isinstance(error, (RequestException, YouTubeRequestFailed))
+
+
+def get_retry_delay(n_try: int, base_delay: float, rate_limited: bool) -> float:
+    """
+    Computes a capped exponential backoff delay with jitter for the given attempt.
+    The jitter (0.5x-1.5x) keeps concurrent clients from retrying in lockstep.
+    """
+    cap = RATE_LIMIT_DELAY_CAP if rate_limited else RETRY_DELAY_CAP
+    delay = min(cap, base_delay * (1 << (n_try - 1)))
+    return random.uniform(delay * 0.5, delay * 1.5)
+
+
+class CaptionSegment(msgspec.Struct):
+    utf8: str = ""
+
+
+class CaptionEvent(msgspec.Struct, rename="camel"):
+    t_start_ms: int = 0
+    d_duration_ms: int = 0
+    segs: list[CaptionSegment] = []
+
+
+class TimedText(msgspec.Struct):
+    events: list[CaptionEvent] = []
+
+
+def json3_transcript_url(url: str) -> str:
+    """
+    Returns the timedtext URL with any existing fmt parameter replaced by fmt=json3.
+    """
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key != "fmt"
+    ]
+    query.append(("fmt", "json3"))
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+def fetch_raw_transcript(transcript) -> list[dict]:
+    """
+    Fetches the transcript entries in YouTube's json3 timedtext format and decodes them with msgspec.
+    HTTP errors are raised as YouTubeRequestFailed so call_with_retries can back off;
+    youtube_transcript_api's XML parsing is only used if the json3 body cannot be decoded.
+    Returns entries shaped like FetchedTranscript.to_raw_data().
+    """
+    # Same request the library makes (session, cookies, proxies), only asking for json3 instead of XML
+    response = transcript._http_client.get(json3_transcript_url(transcript._url))
+    try:
+        response.raise_for_status()
+    except HTTPError as e:
+        raise YouTubeRequestFailed(transcript.video_id, e)
+    try:
+        timed_text = msgspec.json.decode(response.content, type=TimedText)
+    except msgspec.MsgspecError as e:
+        logger.warning(f"Could not decode json3 transcript, falling back to XML: {e}")
+        return transcript.fetch().to_raw_data()
+    entries = []
+    for event in timed_text.events:
+        text = "".join(segment.utf8 for segment in event.segs)
+        # Events without text only position the caption window or break lines
+        if text.strip():
+            entries.append(
+                {
+                    "text": text,
+                    "start": event.t_start_ms / 1000,
+                    "duration": event.d_duration_ms / 1000,
+                }
+            )
+    return entries
+
+
+def format_transcript(fetched_transcript: list[dict]) -> str:
+    """
+    Formats raw transcript entries as one "[HH:MM:SS]text" line per entry.
+    """
+    return "\n".join(
+        "[%s]%s" % (convert_seconds_to_timestamp(entry["start"]), entry["text"])
+        for entry in fetched_transcript
+    )
+
+
+def call_with_retries(func, description: str):
+    """
+    Calls func, retrying failures with capped, jittered exponential backoff and logging all attempts.
+    Errors that are neither network nor rate-limit related are only retried once.
+    TranscriptsDisabled and NoTranscriptFound are re-raised immediately since retrying cannot help.
+    """
+    for n_try in range(1, MAX_RETRIES + 1):
+        try:
+            logger.debug(f"Attempt {n_try} to {description}")
+            return func()
+        except (TranscriptsDisabled, NoTranscriptFound):
+            raise
+        except Exception as e:
+            logger.error(f"[Error] Attempt {n_try} to {description} failed: {e}")
+            rate_limited = is_rate_limited(e)
+            if not (rate_limited or is_network_error(e)) and (
+                n_try >= NON_NETWORK_MAX_TRIES
+            ):
+                logger.error("Non-network error persisted. Giving up.")
+                raise
+            if n_try == MAX_RETRIES:
+                logger.error("Max retries reached. Giving up.")
+                raise
+            delay = get_retry_delay(n_try, BASE_RETRY_DELAY, rate_limited)
+            logger.info(f"Retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
+
+
+def get_video_transcript(
+    video_id: str, proxy: str | None = None, force_fetch: bool = False
+) -> tuple[str, str]:
     """
     Retrieves the transcript for the YouTube video specified by youtube_video_url.
     Returns a tuple (transcript, transcription_language), or raises an error message if unable to do so.
-    Implements an improved retry strategy with exponential backoff and logs all attempts.
-    Optionally uses a proxy for network requests.
+    The transcript list is requested once and shared by all languages; network calls are retried
+    via call_with_retries. Optionally uses a proxy for network requests.
+    Raw transcript entries are cached on disk for a day; force_fetch drops the cached entries first.
     """
-    transcript_text = ""
     languages = ("en", "fa")
-    max_retries = 7
-    base_delay = 2  # seconds
+    # Use proxy if provided, otherwise default
+    proxies = {"http": proxy, "https": proxy} if proxy else None
+    if force_fetch:
+        for language in languages:
+            raw_transcript_cache.delete((video_id, language))
+    # Any cached language avoids the network entirely, so check them all first
+    for language in languages:
+        fetched_transcript = raw_transcript_cache.get((video_id, language))
+        if fetched_transcript is not None:
+            logger.info(f"Transcript for language '{language}' loaded from cache.")
+            return format_transcript(fetched_transcript), language
+    try:
+        transcript_languages = call_with_retries(
+            lambda: YouTubeTranscriptApi.list_transcripts(video_id, proxies=proxies),
+            "list transcripts",
+        )
+    except TranscriptsDisabled:
+        raise ValueError("[Error] Transcripts are disabled for this video.")
+    except Exception:
+        raise ValueError(
+            "[Error] Could not retrieve transcript after multiple attempts."
+        )
+    logger.opt(lazy=True).debug("Transcripts: {}", lambda: transcript_languages)
     for language in languages:
         logger.info(f"Trying language: {language}")
-        for n_try in range(1, max_retries + 1):
-            try:
-                logger.debug(f"Attempt {n_try} for language '{language}'")
-                # Use proxy if provided, otherwise default
-                transcript_languages = YouTubeTranscriptApi.list_transcripts(
-                    video_id,
-                    proxies={"http": proxy, "https": proxy} if proxy else None,
-                )
-                logger.debug(transcript_languages)
-                transcript = transcript_languages.find_transcript([language])
-                logger.debug(f"Found transcript: {transcript}")
-                fetched_transcript = transcript.fetch().to_raw_data()
-                transcript_text = "\n".join(
-                    [
-                        f"[{convert_seconds_to_timestamp(entry['start'])}]{entry['text']}"
-                        for entry in fetched_transcript
-                    ]
-                )
-                return transcript_text, language
-            except TranscriptsDisabled:
-                logger.error("[Error] Transcripts are disabled for this video.")
-                break
-            except NoTranscriptFound:
-                logger.error(
-                    f"[Error] No transcript found for this video in the {language} language."
-                )
-                break
-            except Exception as e:
-                logger.error(f"[Error] Attempt {n_try} failed: {e}")
-                if n_try < max_retries:
-                    delay = base_delay * (2 ** (n_try - 1))
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    logger.error("Max retries reached. Giving up.")
+        try:
+            # Local lookup in the already fetched list, no network involved
+            transcript = transcript_languages.find_transcript([language])
+        except NoTranscriptFound:
+            logger.error(
+                f"[Error] No transcript found for this video in the {language} language."
+            )
+            continue
+        logger.opt(lazy=True).debug("Found transcript: {}", lambda: transcript)
+        try:
+            fetched_transcript = call_with_retries(
+                lambda: fetch_raw_transcript(transcript),
+                f"fetch the {language} transcript",
+            )
+        except Exception:
+            continue
+        raw_transcript_cache.set(
+            (video_id, language), fetched_transcript, expire=RAW_TRANSCRIPT_TTL
+        )
+        return format_transcript(fetched_transcript), language
     raise ValueError("[Error] Could not retrieve transcript after multiple attempts.")
 
 
 class Transcript(SQLModel, table=True):
+    # Serves "latest transcript for video_id" lookups straight from the index
+    __table_args__ = (
+        Index("ix_transcript_video_id_created_at", "video_id", "created_at"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     video_id: str
     url: str
-    transcript: str
+    transcript: bytes  # zstd-compressed UTF-8; rows written before compression hold plain text
     transcription_language: str
     created_at: str
 
 
+def compress_transcript(transcript: str) -> bytes:
+    """
+    Compresses the transcript text for storage in the DB.
+    """
+    return zstandard.compress(
+        transcript.encode("utf-8"), level=TRANSCRIPT_COMPRESSION_LEVEL
+    )
+
+
+def decompress_transcript(data: bytes | str) -> str:
+    """
+    Restores the transcript text from the DB, accepting both compressed and legacy plain-text rows.
+    """
+    if isinstance(data, str):
+        return data
+    if data.startswith(ZSTD_MAGIC):
+        return zstandard.decompress(data).decode("utf-8")
+    return data.decode("utf-8")
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Enables WAL with synchronous=NORMAL on every new connection to cut per-commit fsyncs.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
 def get_engine():
-    return create_engine(f"sqlite:///{DB_PATH}", echo=False)
+    """
+    Returns the process-wide SQLite engine, creating it on first use.
+    check_same_thread is disabled so pooled connections can be used by the batch worker threads.
+    """
+    engine = create_engine(
+        f"sqlite:///{DB_PATH}",
+        echo=False,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
 
 
 def init_db():
     """
     Initializes the SQLite database and creates the transcripts table if it doesn't exist.
+    Also adds indexes missing from databases created before they were introduced.
     """
     engine = get_engine()
     SQLModel.metadata.create_all(engine)
+    for index in Transcript.__table__.indexes:
+        index.create(engine, checkfirst=True)
 
 
-def store_transcript(
-    video_id: str,
-    url: str,
-    transcript: str,
-    transcription_language: str,
-):
+def store_transcripts(transcripts: list[tuple[str, str, str, str]]):
     """
-    Stores the transcript in the SQLite database using SQLModel ORM.
+    Stores (video_id, url, transcript, transcription_language) records in the SQLite database
+    using SQLModel ORM, all in a single transaction.
     """
     engine = get_engine()
     now = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    transcript_obj = Transcript(
-        video_id=video_id,
-        url=url,
-        transcript=transcript,
-        transcription_language=transcription_language,
-        created_at=now,
-    )
+    transcript_objs = [
+        Transcript(
+            video_id=video_id,
+            url=url,
+            transcript=compress_transcript(transcript),
+            transcription_language=transcription_language,
+            created_at=now,
+        )
+        for video_id, url, transcript, transcription_language in transcripts
+    ]
     with Session(engine) as session:
-        session.add(transcript_obj)
+        session.add_all(transcript_objs)
         session.commit()
 
 
@@ -205,13 +430,104 @@ def get_transcript_from_db(video_id: str):
         )
         result = session.exec(statement).first()
         if result:
-            return result.transcript, result.transcription_language
+            return (
+                decompress_transcript(result.transcript),
+                result.transcription_language,
+            )
         return None, None
 
 
+def count_words(text: str) -> int:
+    """
+    Counts whitespace-delimited words without building a list of them.
+    """
+    return sum(1 for _ in WORD_RE.finditer(text))
+
+
+def build_prompt_parts(youtube_video_url: str, video_transcript: str) -> list[str]:
+    """
+    Returns the summarization prompt for one video as a list of parts whose concatenation is the prompt.
+    """
+    return [
+        PROMPT_HEAD,
+        youtube_video_url,
+        PROMPT_MIDDLE,
+        video_transcript,
+        PROMPT_TAIL,
+    ]
+
+
+def copy_to_clipboard(parts: list[str]) -> None:
+    """
+    Copies the concatenation of parts to the system clipboard.
+    On macOS the parts are streamed into pbcopy so the full prompt is never built as one string;
+    elsewhere pyperclip picks the native clipboard backend.
+    """
+    if sys.platform == "darwin":
+        with subprocess.Popen("pbcopy", stdin=subprocess.PIPE, text=True) as process:
+            for part in parts:
+                process.stdin.write(part)
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, "pbcopy")
+    else:
+        pyperclip.copy("".join(parts))
+
+
+def write_prompt_file(video_id: str, parts: list[str]) -> str:
+    """
+    Writes the prompt parts for one video to PROMPTS_PATH/<video_id>.txt and returns the file path.
+    """
+    os.makedirs(PROMPTS_PATH, exist_ok=True)
+    path = os.path.join(PROMPTS_PATH, f"{video_id}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(parts)
+    return path
+
+
+def process_video_url(
+    youtube_video_url: str,
+    proxy: str | None,
+    force_fetch: bool,
+    new_transcripts: list[tuple[str, str, str, str]],
+) -> tuple[str, str] | None:
+    """
+    Loads the transcript for a single URL from the DB, or fetches it from YouTube.
+    Fetched transcripts are appended to new_transcripts so the caller can store them in one batch.
+    Returns (video_id, transcript), or None if the transcript could not be retrieved.
+    """
+    try:
+        video_id = extract_video_id(youtube_video_url)
+        video_transcript = None
+        transcription_language = None
+
+        if not force_fetch:
+            video_transcript, transcription_language = get_transcript_from_db(video_id)
+            if video_transcript:
+                logger.info(f"Transcript for {video_id} loaded from DB.")
+        if not video_transcript:
+            video_transcript, transcription_language = get_video_transcript(
+                video_id, proxy=proxy, force_fetch=force_fetch
+            )
+            new_transcripts.append(
+                (video_id, youtube_video_url, video_transcript, transcription_language)
+            )
+
+    except ValueError as e:
+        logger.error(f"[Error] {youtube_video_url}: {e}")
+        return None
+    return video_id, video_transcript
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Summarize a YouTube video by URL.")
-    parser.add_argument("url", help="YouTube video URL")
+    parser = argparse.ArgumentParser(
+        description="Summarize one or more YouTube videos by URL."
+    )
+    parser.add_argument(
+        "url",
+        nargs="+",
+        help="YouTube video URL(s); with several URLs each prompt is written to "
+        "data/prompts/<video_id>.txt instead of the clipboard",
+    )
     parser.add_argument(
         "--force-fetch",
         action="store_true",
@@ -224,58 +540,95 @@ def main() -> None:
         help="Proxy URL (e.g., http://127.0.0.1:8086 or socks5h://127.0.0.1:2080)",
     )
     args = parser.parse_args()
-    youtube_video_url = args.url
+    youtube_video_urls = args.url
     force_fetch = args.force_fetch
     proxy = args.proxy
 
     init_db()  # Ensure DB and table exist
 
+    # Transcript fetching is network-bound, so process the URLs concurrently
+    new_transcripts = []
+    results = [None] * len(youtube_video_urls)
+    executor = ThreadPoolExecutor(
+        max_workers=min(MAX_WORKERS, len(youtube_video_urls))
+    )
     try:
-        video_id = extract_video_id(youtube_video_url)
-        video_transcript = None
-        transcription_language = None
-
-        if not force_fetch:
-            video_transcript, transcription_language = get_transcript_from_db(video_id)
-            if video_transcript:
-                logger.info("Transcript loaded from DB.")
-        if not video_transcript:
-            video_transcript, transcription_language = get_video_transcript(
-                video_id, proxy=proxy
-            )
+        futures = {
+            executor.submit(
+                process_video_url, url, proxy, force_fetch, new_transcripts
+            ): index
+            for index, url in enumerate(youtube_video_urls)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
             try:
-                store_transcript(
-                    video_id,
-                    youtube_video_url,
-                    video_transcript,
-                    transcription_language,
-                )
-                logger.info("Transcript stored in DB.")
+                results[index] = future.result()
             except Exception as e:
-                logger.error(f"Failed to store transcript in DB: {e}")
-
-    except ValueError as e:
-        logger.error(f"[Error] {e}")
+                logger.error(f"[Error] {youtube_video_urls[index]}: {e}")
+    finally:
+        # Even on Ctrl-C: drop queued URLs, wait for running ones, and keep what was fetched
+        executor.shutdown(cancel_futures=True)
+        if new_transcripts:
+            try:
+                store_transcripts(new_transcripts)
+                logger.info(f"Stored {len(new_transcripts)} transcript(s) in DB.")
+            except Exception as e:
+                logger.error(f"Failed to store transcripts in DB: {e}")
+    results = [result for result in results if result]
+    if not results:
         return
 
-    final_prompt = SUMMARIZATION_PROMPT.format(
-        youtube_video_url=f"https://www.youtube.com/watch?v={video_id}",
-        video_transcript=video_transcript,
-        summary_language="Original Language of the video",
-    )
-    if len(final_prompt) > 2000:
-        logger.debug(final_prompt[:1000] + "\n...\n" + final_prompt[-1000:])
+    # One prompt per video: the instructions describe summarizing a single video
+    prompts = [
+        (
+            video_id,
+            build_prompt_parts(
+                f"https://www.youtube.com/watch?v={video_id}", video_transcript
+            ),
+        )
+        for video_id, video_transcript in results
+    ]
+    if len(prompts) > 1:
+        for video_id, prompt_parts in prompts:
+            try:
+                path = write_prompt_file(video_id, prompt_parts)
+                logger.info(f"Prompt for {video_id} written to {path}.")
+            except OSError as e:
+                logger.error(f"Failed to write prompt for {video_id}: {e}")
     else:
-        logger.debug(final_prompt)
-    try:
-        subprocess.run("pbcopy", text=True, input=final_prompt, check=True)
-        logger.info("Final prompt copied to clipboard.")
-    except Exception as e:
-        logger.error(f"Failed to copy to clipboard: {e}")
-    transcribe_word_count = len(video_transcript.split())
-    logger.debug(f"Transcribe Word Count: {transcribe_word_count:,}")
-    final_prompt_word_count = len(final_prompt.split())
-    logger.debug(f"Final Prompt Word Count: {final_prompt_word_count:,}")
+        prompt_parts = prompts[0][1]
+        prompt_length = sum(len(part) for part in prompt_parts)
+        if prompt_length > 2000:
+            # Preview the start of the template and the end of the transcript
+            logger.opt(lazy=True).debug(
+                "{}\n...\n{}",
+                lambda: prompt_parts[0][:1000],
+                lambda: prompt_parts[-2][-1000:] + prompt_parts[-1],
+            )
+        else:
+            logger.opt(lazy=True).debug("{}", lambda: "".join(prompt_parts))
+        if prompt_length > MAX_CLIPBOARD_CHARS:
+            logger.warning(
+                f"Final prompt is too large to copy to clipboard ({prompt_length:,} chars)."
+            )
+        else:
+            try:
+                copy_to_clipboard(prompt_parts)
+                logger.info("Final prompt copied to clipboard.")
+            except Exception as e:
+                logger.error(f"Failed to copy to clipboard: {e}")
+    # Lazy so the word counts are only computed when DEBUG logging is enabled
+    logger.opt(lazy=True).debug(
+        "Transcribe Word Count: {:,}",
+        lambda: sum(count_words(video_transcript) for _, video_transcript in results),
+    )
+    # Parts always meet at whitespace, so their word counts add up to the prompt's
+    logger.opt(lazy=True).debug(
+        "Final Prompt Word Count: {:,}",
+        lambda: sum(
+            count_words(part) for _, prompt_parts in prompts for part in prompt_parts
+        ),
+    )
 
 
 if __name__ == "__main__":